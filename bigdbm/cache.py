@@ -0,0 +1,13 @@
+"""Optional persistent caches, backed by diskcache."""
+try:
+    import diskcache
+except ImportError:  # optional, see the `cache` extra
+    diskcache = None
+
+
+def open_cache(directory: str) -> "diskcache.Cache":
+    """Open (or create) a persistent cache stored in a directory."""
+    if diskcache is None:
+        raise ImportError("Persistent caching requires diskcache, install bigdbm[cache].")
+
+    return diskcache.Cache(directory)
@@ -1,60 +1,172 @@
 """The Client."""
+import msgspec
 import requests
-from requests import Request, Session
 from requests import RequestException
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import InvalidHeader
+from urllib3.util import Retry
 
+import asyncio
+import random
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
+try:
+    import httpx
+except ImportError:  # optional, see the `http2` extra
+    httpx = None
+
 from bigdbm.schemas import (
     ConfigDates,
     IABJob,
     IntentEvent,
+    ResultPage,
+    PIIResponse,
     UniqueMD5,
     PII,
     MD5WithPII
 )
 from bigdbm.error import BigDBMApiError
+from bigdbm.cache import open_cache
+
+
+# Tag of PII entries in the disk cache, so flushing leaves other entries alone
+PII_CACHE_TAG: str = "pii"
 
 
 class BigDBMClient:
     """
     Client to interface with BigDBM.
 
-    Creating an instance is fairly expensive, as it automatically retrieves
-    an access token and configuration dates.
+    Creating an instance is cheap, the access token is retrieved on the first
+    request and shared between instances using the same credentials.
+
+    With `http2`, job results are retrieved over HTTP/2 with httpx (install the
+    `http2` extra), multiplexing all page requests on a few connections.
+
+    Pulled PII is cached in memory for `pii_cache_ttl` seconds, up to
+    `pii_cache_size` MD5s (0 disables it). With `pii_cache_dir`, it's also kept
+    on disk so repeat runs skip the API for MD5s they've seen before (install
+    the `cache` extra). Use `.flush_pii_cache()` to start fresh.
     """
 
-    def __init__(self, client_id: str, client_secret: str) -> None:
+    # Access tokens shared by all instances, keyed by (client_id, client_secret).
+    # Each key has its own lock so only fetches for the same credentials coalesce,
+    # _TOKEN_LOCK just guards creating those locks.
+    _TOKEN_CACHE: dict[tuple[str, str], tuple[str, int]] = {}
+    _TOKEN_LOCKS: dict[tuple[str, str], threading.Lock] = {}
+    _TOKEN_LOCK = threading.Lock()
+
+    # Max MD5s per PII request
+    _PII_CHUNK: int = 1000
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        http2: bool = False,
+        pii_cache_dir: str | None = None,
+        pii_cache_ttl: float = 7 * 86400,
+        pii_cache_size: int = 100_000
+    ) -> None:
         """Initialize the BigDBM client."""
+        if http2 and httpx is None:
+            raise ImportError("HTTP/2 support requires httpx, install bigdbm[http2].")
+
         self.client_id: str = client_id
         self.client_secret: str = client_secret
+        self.http2: bool = http2
 
         # Access token declarations (defined by _update_token)
         self._access_token: str = ""
         self._access_token_expiration: int = 0  # unix timestamp
-        self._update_token()
 
-    def _update_token(self) -> None:
-        """Update the token inplace."""
-        response = requests.post(
-            "https://aws-prod-auth-service.bigdbm.com/oauth2/token",
-            headers={
-                "Content-Type": "application/x-www-form-urlencoded"
-            },
-            data={
-                "grant_type": "client_credentials",
-                "client_id": self.client_id,
-                "client_secret": self.client_secret
-            }
+        # One session for all calls so connections (and TLS) are reused
+        # across requests and shared by the page-fetching threads.
+        # Transient failures are retried by urllib3 with backoff and jitter.
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            backoff_jitter=0.25,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False  # surface the last response via raise_for_status
+        )
+        self._retry: Retry = retry  # also followed by the HTTP/2 path
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=64, pool_maxsize=64, max_retries=retry)
+        self._session.mount("https://", adapter)
+
+        # Creating a job isn't idempotent, so only retry what the API surely
+        # didn't process: connection failures and 429s. Read errors and 5xx
+        # could mean the job was created, retrying them would duplicate it.
+        create_retry = retry.new(read=0, status_forcelist=(429,))
+        self._session.mount(
+            "https://aws-prod-intent-api.bigdbm.com/intent/createList",
+            HTTPAdapter(max_retries=create_retry)
         )
 
-        response.raise_for_status()
-        response_json = response.json()
-        
-        self._access_token = response_json["access_token"]
-        self._access_token_expiration = int(time.time() - 10) + response_json["expires_in"]
+        # PII already pulled by this client as (expiration unix timestamp, PII),
+        # keyed by (output_id, md5). Least recently used entries are dropped
+        # past `pii_cache_size`.
+        self._pii_cache: OrderedDict[
+            tuple[int, str], tuple[float, dict[str, Any]]
+        ] = OrderedDict()
+        self._pii_cache_lock = threading.Lock()
+        self.pii_cache_size: int = pii_cache_size
+        self._pii_disk_cache = open_cache(pii_cache_dir) if pii_cache_dir else None
+        self.pii_cache_ttl: float = pii_cache_ttl  # seconds
+
+    def _update_token(self, force: bool = False) -> None:
+        """
+        Update the token inplace.
+
+        Reuses a still valid token from the shared cache if another instance
+        (or thread) already fetched one, otherwise fetches and caches a new one.
+        With `force`, the current token is considered rejected and is replaced
+        even if it hasn't expired yet.
+        """
+        cache_key: tuple[str, str] = (self.client_id, self.client_secret)
+
+        with BigDBMClient._TOKEN_LOCK:
+            token_lock = BigDBMClient._TOKEN_LOCKS.setdefault(cache_key, threading.Lock())
+
+        with token_lock:
+            cached: tuple[str, int] | None = BigDBMClient._TOKEN_CACHE.get(cache_key)
+
+            if (
+                cached is None
+                or time.time() >= cached[1]
+                or (force and cached[0] == self._access_token)
+            ):
+                response = self._session.post(
+                    "https://aws-prod-auth-service.bigdbm.com/oauth2/token",
+                    headers={
+                        "Content-Type": "application/x-www-form-urlencoded",
+                        "Authorization": None  # don't send the old bearer token
+                    },
+                    data={
+                        "grant_type": "client_credentials",
+                        "client_id": self.client_id,
+                        "client_secret": self.client_secret
+                    }
+                )
+
+                response.raise_for_status()
+                response_json = response.json()
+
+                cached = (
+                    response_json["access_token"],
+                    int(time.time() - 10) + response_json["expires_in"]
+                )
+                BigDBMClient._TOKEN_CACHE[cache_key] = cached
+
+        self._access_token, self._access_token_expiration = cached
+        self._session.headers["Authorization"] = f"Bearer {self._access_token}"
         return
 
     def _access_token_valid(self) -> bool:
@@ -70,44 +182,66 @@ class BigDBMClient:
 
         return True
 
-    def _request(self, request: Request) -> dict:
+    def _send(
+        self,
+        method: str,
+        url: str,
+        json: Any = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None
+    ) -> requests.Response:
         """
         Abstracted requesting mechanism handling access token.
         Raises for status automatically. 
         
-        Returns a dictionary of the response's JSON.
+        Returns the raw response.
         """
         if not self._access_token_valid():
             self._update_token()
 
-        # Insert access token into request
-        request.headers.update({
-            "Authorization": f"Bearer {self._access_token}"
-        })
+        # Encode JSON bodies with msgspec rather than letting requests use stdlib json
+        data: bytes | None = None
+        if json is not None:
+            data = msgspec.json.encode(json)
+            headers = {"Content-Type": "application/json", **(headers or {})}
 
-        try:
-            with Session() as session:
-                response = session.send(request.prepare())
-            response.raise_for_status()
-        except RequestException:
-            # If there's an error, wait and try just once more
-            time.sleep(10)
-            with Session() as session:
-                response = session.send(request.prepare())
-            response.raise_for_status()
-
-        return response.json()
+        response = self._session.request(
+            method, url, data=data, params=params, headers=headers
+        )
+
+        if response.status_code == 401:
+            # Token was rejected before its expiration, refresh and try once more
+            self._update_token(force=True)
+            response = self._session.request(
+                method, url, data=data, params=params, headers=headers
+            )
+
+        response.raise_for_status()
+        return response
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        json: Any = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None
+    ) -> dict:
+        """
+        Request through `_send`.
+        Returns a dictionary of the response's JSON.
+        """
+        response = self._send(method, url, json=json, params=params, headers=headers)
+        return msgspec.json.decode(response.content)
     
     def get_config_dates(self) -> ConfigDates:
         """Get the configuration dates from /config."""
         response_json: dict[str, str] = self._request(
-            Request(
-                method="GET",
-                url="https://aws-prod-intent-api.bigdbm.com/intent/configData",
-                headers={
-                    "Content-Type": "application/x-www-form-urlencoded"
-                }
-            )
+            method="GET",
+            url="https://aws-prod-intent-api.bigdbm.com/intent/configData",
+            headers={
+                "Content-Type": "application/x-www-form-urlencoded"
+            }
         )
 
         return ConfigDates(
@@ -122,7 +256,7 @@ class BigDBMClient:
         """
         config_dates: ConfigDates = self.get_config_dates()
 
-        request = Request(
+        response_json: dict = self._request(
             method="POST",
             url="https://aws-prod-intent-api.bigdbm.com/intent/createList",
             headers={
@@ -135,27 +269,65 @@ class BigDBMClient:
             }
         )
 
-        return int(self._request(request)["listQueueId"])
+        return int(response_json["listQueueId"])
 
     def get_list_status(self, list_queue_id: int) -> int:
         """Get the processing status of a list."""
-        request = Request(
+        response_json: dict = self._request(
             method="GET",
             url="https://aws-prod-intent-api.bigdbm.com/intent/checkList",
             params={"listQueueId": list_queue_id}
         )
 
-        return int(self._request(request)["status"])
+        return int(response_json["status"])
     
-    def wait_until_completion(self, list_queue_id: int) -> None:
-        """Wait until a job has finished processing."""
-        while (status := self.get_list_status(list_queue_id)) != 100:
-            if status > 100:
-                raise BigDBMApiError(f"List ID {list_queue_id} had an error.")
-            
-            time.sleep(3)
+    def wait_until_completion(
+        self,
+        list_queue_id: int,
+        timeout: float | None = None,
+        max_errors: int = 5
+    ) -> None:
+        """
+        Wait until a job has finished processing.
 
-        return
+        Polls with exponential backoff (with jitter) that resets whenever the
+        status advances. Up to `max_errors` consecutive request errors are
+        retried before raising. Raises BigDBMApiError if the job errors or
+        `timeout` seconds pass.
+        """
+        min_delay: float = 3.0
+        max_delay: float = 60.0
+        delay: float = min_delay
+
+        deadline: float | None = None if timeout is None else time.monotonic() + timeout
+        previous_status: int | None = None
+        n_errors: int = 0
+
+        while True:
+            try:
+                status: int = self.get_list_status(list_queue_id)
+            except RequestException:
+                n_errors += 1
+                if n_errors > max_errors:
+                    raise
+            else:
+                n_errors = 0
+
+                if status == 100:
+                    return
+
+                if status > 100:
+                    raise BigDBMApiError(f"List ID {list_queue_id} had an error.")
+
+                if status != previous_status:
+                    delay = min_delay
+                    previous_status = status
+
+            if deadline is not None and time.monotonic() + delay > deadline:
+                raise BigDBMApiError(f"List ID {list_queue_id} did not finish in time.")
+
+            time.sleep(delay + random.uniform(0, delay * 0.25))
+            delay = min(delay * 1.5, max_delay)
 
     def create_and_wait(self, iab_job: IABJob) -> int:
         """
@@ -166,69 +338,215 @@ class BigDBMClient:
         self.wait_until_completion(list_queue_id)
         return list_queue_id
     
-    def _fetch_result_response(self, list_queue_id: int, page_num: int) -> dict:
-        """Return the JSON API response when pulling a page's results."""
-        request = Request(
+    def _fetch_result_response(self, list_queue_id: int, page_num: int) -> ResultPage:
+        """
+        Return the API response when pulling a page's results, decoded
+        directly into typed structs.
+        """
+        response = self._send(
             method="POST",
             url="https://aws-prod-intent-api.bigdbm.com/intent/result",
             headers={"Content-Type": "application/json"},
             json={"ListQueueId": list_queue_id, "Page": page_num}
         )
 
-        return self._request(request)
-
-    def _extract_intent_events(self, fetch_result_json: dict) -> list[IntentEvent]:
-        """Pull the intent events listed on a job's results page."""
-        return [
-            IntentEvent(
-                md5=obj["mD5"],
-                sentence=obj["sentence"]
-            )
-            for obj in fetch_result_json["result"]
-        ]
+        return msgspec.json.decode(response.content, type=ResultPage)
 
     def retrieve_md5s(self, list_queue_id: int, n_threads: int = 30) -> list[IntentEvent]:
-        """Pull all MD5s from an intent job with multithreads."""
-        # First page
-        response_json: dict = self._fetch_result_response(list_queue_id, 1)
-        page_count: int = response_json["totalCount"]
-        intent_events: list[IntentEvent] = self._extract_intent_events(response_json)
+        """
+        Pull all MD5s from an intent job with multithreads.
+        Uses at most `n_threads`, fewer if the job has fewer pages.
+
+        If the client was created with `http2`, pages are instead pulled
+        asynchronously with at most `n_threads` requests in flight. This runs
+        its own event loop, so it can't be called from a running one.
+        """
+        if self.http2:
+            return asyncio.run(self._retrieve_md5s_async(list_queue_id, n_threads))
 
         def pull_page(p: int) -> list[IntentEvent]:
-            return self._extract_intent_events(
-                self._fetch_result_response(list_queue_id, p)
-            )
+            return self._fetch_result_response(list_queue_id, p).result
 
-        with ThreadPoolExecutor(max_workers=n_threads) as executor:
-            result = executor.map(
-                pull_page,
-                range(2, page_count+1)  # ex. [2, 3, 4] for page_count of 4
-            )
+        # Threads are only started as work is submitted, so short jobs
+        # never spin up the full pool
+        executor = ThreadPoolExecutor(max_workers=max(1, n_threads))
 
+        try:
+            # Request page 2 alongside the first page, it's discarded if it
+            # turns out not to exist
+            first_page = executor.submit(self._fetch_result_response, list_queue_id, 1)
+            second_page = executor.submit(pull_page, 2)
+
+            result_page: ResultPage = first_page.result()
+            page_count: int = result_page.total_count
+
+            # Pages are stored by index so they complete in any order but keep ordering
+            pages: list[list[IntentEvent] | None] = [None] * max(page_count, 1)
+            pages[0] = result_page.result
+
+            if page_count >= 2:
+                futures = {second_page: 2}
+                futures.update({
+                    executor.submit(pull_page, p): p
+                    for p in range(3, page_count+1)  # ex. [3, 4] for page_count of 4
+                })
+
+                for future in as_completed(futures):
+                    pages[futures[future] - 1] = future.result()
+        finally:
+            # Don't wait on a discarded page 2 (or on the rest after an error)
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        intent_events: list[IntentEvent] = []
         page: list[IntentEvent]
-        for page in result:
+        for page in pages:
             intent_events.extend(page)
 
         return intent_events
 
+    def _retry_delay(self, n_retry: int, retry_after: str | None = None) -> float:
+        """
+        Seconds to wait before retry number `n_retry` (starting at 1), following
+        the session's urllib3 Retry policy. Used where urllib3 doesn't apply.
+        """
+        if retry_after and self._retry.respect_retry_after_header:
+            try:
+                return self._retry.parse_retry_after(retry_after)
+            except InvalidHeader:
+                pass
+
+        backoff: float = self._retry.backoff_factor * 2 ** (n_retry - 1)
+        backoff += random.uniform(0, self._retry.backoff_jitter)
+        return min(backoff, self._retry.backoff_max)
+
+    async def _retrieve_md5s_async(
+        self,
+        list_queue_id: int,
+        max_streams: int = 30
+    ) -> list[IntentEvent]:
+        """
+        Pull all MD5s from an intent job over HTTP/2.
+        All pages are multiplexed on a few connections.
+
+        Handles errors like `_send`: a rejected token is refreshed once, failed
+        connections and retryable statuses are retried per the session's Retry
+        policy, and failures raise `requests` exceptions.
+        """
+        if not self._access_token_valid():
+            self._update_token()
+
+        # A new client per call, as connections are bound to this event loop
+        async with httpx.AsyncClient(
+            timeout=httpx.Timeout(30, pool=None),  # queued streams wait on max_streams
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=4)
+            )
+        ) as aclient:
+            semaphore = asyncio.Semaphore(max_streams)
+            token_lock = asyncio.Lock()
+
+            async def pull_page(p: int) -> ResultPage:
+                refreshed: bool = False
+                n_retry: int = 0
+
+                while True:
+                    token: str = self._access_token
+                    retry_after: str | None = None
+
+                    try:
+                        async with semaphore:
+                            response = await aclient.post(
+                                "https://aws-prod-intent-api.bigdbm.com/intent/result",
+                                headers={
+                                    "Authorization": f"Bearer {token}",
+                                    "Content-Type": "application/json"
+                                },
+                                content=msgspec.json.encode(
+                                    {"ListQueueId": list_queue_id, "Page": p}
+                                )
+                            )
+                    except httpx.TransportError as e:
+                        if n_retry >= self._retry.total:
+                            if isinstance(e, httpx.TimeoutException):
+                                raise requests.Timeout(str(e)) from e
+                            raise requests.ConnectionError(str(e)) from e
+                    else:
+                        if response.status_code == 401 and not refreshed:
+                            # Token was rejected before its expiration, refresh
+                            # (once across pages) and try once more
+                            async with token_lock:
+                                if self._access_token == token:
+                                    await asyncio.to_thread(self._update_token, True)
+
+                            refreshed = True
+                            continue
+
+                        if (
+                            response.status_code not in self._retry.status_forcelist
+                            or n_retry >= self._retry.total
+                        ):
+                            break
+
+                        retry_after = response.headers.get("Retry-After")
+
+                    n_retry += 1
+                    await asyncio.sleep(self._retry_delay(n_retry, retry_after))
+
+                if response.is_error:
+                    raise requests.HTTPError(
+                        f"{response.status_code} Error: {response.reason_phrase} "
+                        f"for url: {response.url}"
+                    )
+
+                return msgspec.json.decode(response.content, type=ResultPage)
+
+            # Request page 2 alongside the first page, it's discarded if it
+            # turns out not to exist
+            second_page = asyncio.create_task(pull_page(2))
+            tasks: list[asyncio.Task] = [second_page]
+
+            try:
+                first_page: ResultPage = await pull_page(1)
+
+                if first_page.total_count < 2:
+                    return first_page.result
+
+                tasks.extend(
+                    asyncio.create_task(pull_page(p))
+                    for p in range(3, first_page.total_count+1)
+                )
+                other_pages: list[ResultPage] = await asyncio.gather(*tasks)
+            finally:
+                # Don't leave discarded or orphaned requests running on a closed client
+                for task in tasks:
+                    task.cancel()
+
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        intent_events: list[IntentEvent] = list(first_page.result)
+        page: ResultPage
+        for page in other_pages:
+            intent_events.extend(page.result)
+
+        return intent_events
+
     def uniquify_md5s(self, md5s: list[IntentEvent]) -> list[UniqueMD5]:
         """
         Take a list of raw intent events and create unique MD5s 
         each with all sentences.
         """
-        md5s_dict: dict[str, list[str]] = {}
+        # Sentences are deduplicated as they're aggregated
+        md5s_dict: defaultdict[str, set[str]] = defaultdict(set)
 
         for md5 in md5s:
-            if md5.md5 not in md5s_dict:
-                md5s_dict[md5.md5] = []
-
-            md5s_dict[md5.md5].append(md5.sentence)
+            md5s_dict[md5.md5].add(md5.sentence)
 
         # Convert to unique model for auto validation
         key: str
-        val: list[str]
+        val: set[str]
 
-        return [UniqueMD5(md5=key, sentences=val) for key, val in md5s_dict.items()]
+        return [UniqueMD5(md5=key, sentences=list(val)) for key, val in md5s_dict.items()]
 
     def check_numbers(self, iab_job: IABJob) -> dict[str, int]:
         """
@@ -249,9 +567,9 @@ class BigDBMClient:
             "unique": len(unique_md5s)
         }
 
-    def _pull_pii(self, md5s: list[str], output_id: int = 10008) -> dict[str, dict[str, Any]]:
-        """Retrieve PII for a list of MD5 objects."""
-        request = Request(
+    def _pull_pii_chunk(self, md5s: list[str], output_id: int) -> dict[str, dict[str, Any]]:
+        """Retrieve PII for a single request's worth of MD5s."""
+        response = self._send(
             method="POST",
             url="https://aws-prod-dataapi-v09.bigdbm.com/GetDataBy/Md5",
             headers={
@@ -265,14 +583,117 @@ class BigDBMClient:
         )
 
         # Each dictionary is a single object in a list
-        data: dict[str, list[dict[str, Any]]] = self._request(request)["returnData"]
+        pii_response: PIIResponse = msgspec.json.decode(response.content, type=PIIResponse)
 
         # Remove the list and expose only the object
-        for key in data:
-            data[key] = data[key][0]
+        return {key: val[0] for key, val in pii_response.return_data.items()}
+
+    def _get_cached_pii(self, key: tuple[int, str]) -> dict[str, Any] | None:
+        """
+        Get unexpired PII from the in-memory cache, marking it as recently used.
+        """
+        with self._pii_cache_lock:
+            entry: tuple[float, dict[str, Any]] | None = self._pii_cache.get(key)
+            if entry is None:
+                return None
+
+            if time.time() >= entry[0]:
+                del self._pii_cache[key]
+                return None
+
+            self._pii_cache.move_to_end(key)
+            return entry[1]
+
+    def _cache_pii(
+        self,
+        key: tuple[int, str],
+        pii: dict[str, Any],
+        expiration: float | None = None
+    ) -> None:
+        """
+        Add PII to the in-memory cache, evicting the least recently used.
+        Expires at the `expiration` unix timestamp, or after `pii_cache_ttl`.
+        """
+        if self.pii_cache_size <= 0:
+            return
+
+        if expiration is None:
+            expiration = time.time() + self.pii_cache_ttl
+
+        with self._pii_cache_lock:
+            self._pii_cache[key] = (expiration, pii)
+            self._pii_cache.move_to_end(key)
+
+            while len(self._pii_cache) > self.pii_cache_size:
+                self._pii_cache.popitem(last=False)
+
+    def _pull_pii(
+        self,
+        md5s: list[str],
+        output_id: int = 10008,
+        n_threads: int = 10
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Retrieve PII for a list of MD5 objects.
+
+        MD5s already pulled by this client (or found in the disk cache) are
+        served from cache, the rest are requested concurrently in chunks of at
+        most `_PII_CHUNK`.
+        """
+        data: dict[str, dict[str, Any]] = {}
+        missing: list[str] = []
+
+        for md5 in dict.fromkeys(md5s):
+            pii: dict[str, Any] | None = self._get_cached_pii((output_id, md5))
+
+            if pii is None and self._pii_disk_cache is not None:
+                pii, expiration = self._pii_disk_cache.get((output_id, md5), expire_time=True)
+                if pii is not None:
+                    # Don't outlive the disk entry
+                    self._cache_pii((output_id, md5), pii, expiration)
+
+            if pii is None:
+                missing.append(md5)
+            else:
+                data[md5] = dict(pii)  # callers get their own copy
+
+        if not missing:
+            return data
+
+        chunks: list[list[str]] = [
+            missing[i:i+self._PII_CHUNK] for i in range(0, len(missing), self._PII_CHUNK)
+        ]
+
+        with ThreadPoolExecutor(max_workers=min(n_threads, len(chunks))) as executor:
+            results = executor.map(
+                lambda chunk: self._pull_pii_chunk(chunk, output_id), chunks
+            )
+
+            chunk_data: dict[str, dict[str, Any]]
+            for chunk_data in results:
+                for md5, pii in chunk_data.items():
+                    self._cache_pii((output_id, md5), pii)
+
+                    if self._pii_disk_cache is not None:
+                        self._pii_disk_cache.set(
+                            (output_id, md5), pii, expire=self.pii_cache_ttl, tag=PII_CACHE_TAG
+                        )
+
+                data.update({md5: dict(pii) for md5, pii in chunk_data.items()})
 
         return data
 
+    def flush_pii_cache(self) -> None:
+        """
+        Forget all cached PII, in memory and on disk. Other entries sharing the
+        cache directory (like validator verdicts) are kept.
+        """
+        with self._pii_cache_lock:
+            self._pii_cache.clear()
+
+        if self._pii_disk_cache is not None:
+            self._pii_disk_cache.evict(PII_CACHE_TAG)
+
     def pii_for_unique_md5s(self, unique_md5s: list[UniqueMD5]) -> list[MD5WithPII]:
         """
         Pull PII given a list of unique MD5s.
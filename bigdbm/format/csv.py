@@ -1,8 +1,7 @@
 """Format into CSV strings."""
-import pandas as pd
+import csv
 
 from io import StringIO
-from typing import Any
 
 from bigdbm.format.base import BaseOutputFormatter
 from bigdbm.schemas import MD5WithPII
@@ -53,19 +52,9 @@ class CSVStringFormatter(BaseOutputFormatter):
         if not pii_md5s:
             return ""
 
-        lead_dicts: list[dict[str, Any]] = [
-            {
-                "md5": md5.md5,
-                "intents": ", ".join(md5.sentences),
-                **md5.pii.as_lead_export()
-            }
-            for md5 in pii_md5s
-        ]
-
-        # Convert to DataFrame for exporting
-        pii_df: pd.DataFrame = pd.DataFrame(lead_dicts)[self.output_columns]
-
-        # Convert to CSV string
+        # Stream rows straight into the CSV string
         string_io = StringIO()
-        pii_df.to_csv(string_io, index=False)
+        writer = csv.writer(string_io, lineterminator="\n")
+        writer.writerow(self.output_columns)
+        MD5WithPII.stream_export_rows(pii_md5s, writer, self.output_columns)
         return string_io.getvalue()
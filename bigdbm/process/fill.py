@@ -2,7 +2,7 @@
 from bigdbm.process.base import BaseProcessor
 from bigdbm.client import BigDBMClient
 from bigdbm.schemas import IABJob, UniqueMD5, IntentEvent, MD5WithPII
-from bigdbm.validate.base import BaseValidator
+from bigdbm.validate.base import run_validators
 
 
 class FillProcessor(BaseProcessor):
@@ -35,7 +35,9 @@ class FillProcessor(BaseProcessor):
         """
         # Extend the number of hems in the initial job
         n_hems: int = iab_job.n_hems  # true amount of PII to return
-        iab_job.n_hems = int(iab_job.n_hems * self.intent_multiplier)
+        iab_job = IABJob(
+            **{**iab_job.model_dump(), "n_hems": int(iab_job.n_hems * self.intent_multiplier)}
+        )
 
         # Run the first job for MD5s
         list_queue_id: int = self.client.create_and_wait(iab_job)
@@ -55,9 +57,7 @@ class FillProcessor(BaseProcessor):
             md5s_with_pii: list[MD5WithPII] = self.client.pii_for_unique_md5s(md5s_job)
 
             # Utilize all registered validators to filter leads
-            validator: BaseValidator
-            for validator in self.validators:
-                md5s_with_pii = validator.validate(md5s_with_pii)
+            md5s_with_pii = run_validators(self.validators, md5s_with_pii)
 
             # Add post-validated (remaining) leads
             return_md5s.extend(md5s_with_pii)
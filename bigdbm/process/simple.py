@@ -1,7 +1,7 @@
 """Simple linear pipeline processor. Nothing special, just follow the methods."""
 from bigdbm.process.base import BaseProcessor
 from bigdbm.schemas import IABJob, MD5WithPII, IntentEvent, UniqueMD5
-from bigdbm.validate.base import BaseValidator
+from bigdbm.validate.base import run_validators
 
 
 class SimpleProcessor(BaseProcessor):
@@ -14,8 +14,4 @@ class SimpleProcessor(BaseProcessor):
         unique_md5s: list[UniqueMD5] = self.client.uniquify_md5s(intent_events)
         md5s_with_pii: list[MD5WithPII] = self.client.pii_for_unique_md5s(unique_md5s)
 
-        validator: BaseValidator
-        for validator in self.validators:
-            md5s_with_pii = validator.validate(md5s_with_pii)
-
-        return md5s_with_pii
+        return run_validators(self.validators, md5s_with_pii)
@@ -1,8 +1,11 @@
 """Datatypes for working with the API."""
-from pydantic import BaseModel, Field, field_validator, model_validator
+import msgspec
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
-from typing import Any, Self
+from typing import Any, Callable, Iterable, Self, Sequence
 from enum import Enum
+from functools import cached_property
+from operator import attrgetter
 
 from bigdbm.taxonomy import code_to_category
 
@@ -14,18 +17,25 @@ class ConfigDates(BaseModel):
 
 
 class IABJob(BaseModel):
-    """Payload for creating an IAB job."""
-    intent_categories: list[str] = Field(
-        default_factory=list, description="List of IAB intent categories"
+    """
+    Payload for creating an IAB job.
+
+    Frozen, with tuple fields (lists are accepted and converted), so the API
+    payload can be computed once and reused. To change a job, create a new one.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    intent_categories: tuple[str, ...] = Field(
+        default_factory=tuple, description="List of IAB intent categories"
     )
-    zips: list[str] = Field(
-        default_factory=list, description="List of zip codes"
+    zips: tuple[str, ...] = Field(
+        default_factory=tuple, description="List of zip codes"
     )
-    keywords: list[str] = Field(
-        default_factory=list, description="List of keywords"
+    keywords: tuple[str, ...] = Field(
+        default_factory=tuple, description="List of keywords"
     )
-    domains: list[str] = Field(
-        default_factory=list, description="List of domains"
+    domains: tuple[str, ...] = Field(
+        default_factory=tuple, description="List of domains"
     )
     n_hems: int
 
@@ -45,8 +55,9 @@ class IABJob(BaseModel):
 
         return self
 
-    def as_payload(self) -> dict[str, str]:
-        """Convert into dictionary payload."""
+    @cached_property
+    def payload(self) -> dict[str, str | int]:
+        """Dictionary payload, computed once."""
         return {
             "IABs": ",".join(self.intent_categories),
             "Zips": ",".join(self.zips),
@@ -55,16 +66,37 @@ class IABJob(BaseModel):
             "NumberOfHems": self.n_hems
         }
 
+    def as_payload(self) -> dict[str, str | int]:
+        """Convert into dictionary payload."""
+        return dict(self.payload)
+
 
-class IntentEvent(BaseModel):
+class IntentEvent(msgspec.Struct):
     """
     MD5 intent event as returned by API.
     Timestamp not supported yet.
+
+    A msgspec struct rather than a pydantic model, as jobs return one per
+    result row and these are decoded straight from the response bytes.
     """
-    md5: str
+    md5: str = msgspec.field(name="mD5")
     sentence: str
 
 
+class ResultPage(msgspec.Struct):
+    """A page of intent events as returned by the /intent/result route."""
+    result: list[IntentEvent]
+    total_count: int = msgspec.field(name="totalCount")
+
+
+class PIIResponse(msgspec.Struct):
+    """
+    Response of the /GetDataBy/Md5 route.
+    Each MD5 maps to a list holding a single dictionary of PII.
+    """
+    return_data: dict[str, list[dict[str, Any]]] = msgspec.field(name="returnData")
+
+
 class UniqueMD5(BaseModel):
     """
     Unique MD5 with all the associated sentences.
@@ -94,6 +126,12 @@ class MobilePhone(BaseModel):
     do_not_call: bool
 
 
+# (phone, do not call) key pairs of the API's mobile phone fields
+_PHONE_KEYS: tuple[tuple[str, str], ...] = tuple(
+    (f"Mobile_Phone_{i}", f"Mobile_Phone_{i}_DNC") for i in range(1, 3+1)
+)
+
+
 class Gender(str, Enum):
     """Classifications of genders."""
     MALE = "Male"
@@ -149,21 +187,17 @@ class PII(BaseModel):
     @classmethod
     def from_api_dict(cls, api_dict: dict[str, Any]) -> Self:
         """Read in the data and parse the mobile phones."""
-        mobile_phones: list[MobilePhone] = []
-        for i in range(1, 3+1):
-            if f"Mobile_Phone_{i}" in api_dict:
-                phone: str = api_dict[f"Mobile_Phone_{i}"]
-
-                if not phone:
-                    continue
-
-                dnc: bool = True if api_dict[f"Mobile_Phone_{i}_DNC"] == "1" else False
-                mobile_phones.append(MobilePhone(phone=phone, do_not_call=dnc))
-
-        if not api_dict["Email_Array"]:
-            api_dict["Email_Array"] = []
-
-        return cls(**api_dict, mobile_phones=mobile_phones)
+        mobile_phones: list[MobilePhone] = [
+            MobilePhone(phone=api_dict[phone_key], do_not_call=api_dict.get(dnc_key) == "1")
+            for phone_key, dnc_key in _PHONE_KEYS
+            if api_dict.get(phone_key)
+        ]
+
+        # Don't modify the input, it may be cached
+        return cls(
+            **{**api_dict, "Email_Array": api_dict["Email_Array"] or []},
+            mobile_phones=mobile_phones
+        )
 
     def as_lead_export(self) -> dict[str, Any]:
         """
@@ -220,3 +254,58 @@ class MD5WithPII(UniqueMD5):
     valudation.
     """
     pii: PII
+
+    @staticmethod
+    def stream_export_rows(
+        rows: Iterable["MD5WithPII"],
+        writer: Any,
+        columns: Sequence[str] | None = None
+    ) -> None:
+        """
+        Write each MD5 as a lead export row to a `csv.writer` (or anything with
+        `.writerow`). Values match `PII.as_lead_export` plus `md5` and `intents`,
+        but are read straight off the attributes instead of dumping each model.
+
+        Columns default to every export column. Does not write a header.
+        """
+        getters = [LEAD_EXPORT_GETTERS[column] for column in (columns or LEAD_EXPORT_GETTERS)]
+
+        for row in rows:
+            writer.writerow([getter(row) for getter in getters])
+
+
+def _email_getter(pos: int) -> Callable[[MD5WithPII], str | None]:
+    """Getter for the email at a position, if there is one."""
+    def getter(md5: MD5WithPII) -> str | None:
+        emails = md5.pii.emails
+        return emails[pos] if pos < len(emails) else None
+
+    return getter
+
+
+def _phone_getter(pos: int, attr: str) -> Callable[[MD5WithPII], Any]:
+    """Getter for an attribute of the mobile phone at a position, if there is one."""
+    def getter(md5: MD5WithPII) -> Any:
+        phones = md5.pii.mobile_phones
+        return getattr(phones[pos], attr) if pos < len(phones) else None
+
+    return getter
+
+
+# Lead export columns and how to read them off an MD5WithPII, built once
+LEAD_EXPORT_GETTERS: dict[str, Callable[[MD5WithPII], Any]] = {
+    **{
+        field: attrgetter(f"pii.{field}")
+        for field in PII.model_fields
+        if field not in ("id", "emails", "mobile_phones", "gender")
+    },
+    "gender": lambda md5: md5.pii.gender.value,
+    **{f"email_{pos + 1}": _email_getter(pos) for pos in range(3)},
+    **{
+        f"phone_{pos + 1}{suffix}": _phone_getter(pos, attr)
+        for pos in range(3)
+        for suffix, attr in (("", "phone"), ("_dnc", "do_not_call"))
+    },
+    "md5": attrgetter("md5"),
+    "intents": lambda md5: ", ".join(md5.sentences)
+}
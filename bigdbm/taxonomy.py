@@ -1,11 +1,19 @@
 """Read the taxonomy."""
+from functools import lru_cache
 from pathlib import Path
 import pandas as pd
-            
 
+
+@lru_cache(maxsize=1)
+def _taxonomy() -> pd.DataFrame:
+    """Read the taxonomy file once."""
+    return pd.read_csv(Path(__file__).parent / 'taxonomy.tsv', sep="\t")
+
+
+@lru_cache(maxsize=None)
 def code_to_category(code: str | int) -> str:
     """Return the category for a given code."""
-    df = pd.read_csv(Path(__file__).parent / 'taxonomy.tsv', sep="\t")
+    df = _taxonomy()
     code = str(code)
 
     result: pd.DataFrame = df[df["Unique ID"] == code]
@@ -10,3 +10,48 @@ class BaseValidator(ABC):
     @abstractmethod
     def validate(self, md5s: list[MD5WithPII]) -> list[MD5WithPII]:
         """Remove MD5s that are deemed invalid by implemented criteria."""
+
+
+class FilterValidator(BaseValidator):
+    """
+    Validator that keeps or removes each MD5 on its own merits.
+
+    Implement `.matches()` instead of `.validate()`. Consecutive filter validators
+    are fused into a single pass over the MD5s by `run_validators`.
+    """
+
+    @abstractmethod
+    def matches(self, md5: MD5WithPII) -> bool:
+        """Whether the MD5 is valid and should be kept."""
+
+    def validate(self, md5s: list[MD5WithPII]) -> list[MD5WithPII]:
+        """Remove MD5s that don't match."""
+        return [md5 for md5 in md5s if self.matches(md5)]
+
+
+def run_validators(validators: list[BaseValidator], md5s: list[MD5WithPII]) -> list[MD5WithPII]:
+    """
+    Run validators in order on a list of MD5s.
+    Runs of consecutive filter validators only traverse the MD5s once.
+    """
+    filters: list[FilterValidator] = []
+
+    def flush(md5s: list[MD5WithPII]) -> list[MD5WithPII]:
+        """Apply and clear the pending filters."""
+        if len(filters) == 1:
+            md5s = filters[0].validate(md5s)
+        elif filters:
+            md5s = [md5 for md5 in md5s if all(f.matches(md5) for f in filters)]
+
+        filters.clear()
+        return md5s
+
+    validator: BaseValidator
+    for validator in validators:
+        if isinstance(validator, FilterValidator):
+            filters.append(validator)
+            continue
+
+        md5s = validator.validate(flush(md5s))
+
+    return flush(md5s)
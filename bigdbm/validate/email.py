@@ -1,22 +1,68 @@
 """Validate emails using MillionVerifier."""
 import requests
 
+import csv
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+
+from bigdbm.cache import open_cache
 from bigdbm.schemas import MD5WithPII
 from bigdbm.validate.base import BaseValidator
 
 
+BULK_API_URL: str = "https://bulkapi.millionverifier.com/bulkapi/v2"
+
+# MillionVerifier result codes and the result names used by bulk files
+RESULTS: dict[int, str] = {
+    1: "ok",
+    2: "catch_all",
+    3: "unknown",
+    4: "error",
+    5: "disposable",
+    6: "invalid"
+}
+
+# Results that may change on a retry, so aren't cached
+TEMPORARY_RESULTS: tuple[str, ...] = ("unknown", "error")
+
+
 class EmailValidator(BaseValidator):
     """
     Remove emails determined to not be 'good' by MillionVerifier.
+
+    Batches of at least `bulk_threshold` unique emails are validated with one
+    upload to the bulk API, smaller batches are validated one email at a time.
+
+    With `drop_empty`, hems left without any emails are removed as well.
+
+    With `cache_dir`, final verdicts are kept on disk for `cache_ttl` seconds so
+    emails seen in previous runs aren't validated again. Unknown results and
+    errors are retried next time.
     """
 
-    def __init__(self, million_key: str) -> None:
+    def __init__(
+        self,
+        million_key: str,
+        bulk_threshold: int = 20,
+        bulk_timeout: float = 1800,
+        drop_empty: bool = False,
+        cache_dir: str | None = None,
+        cache_ttl: float = 30 * 86400
+    ) -> None:
         """Initialize with MillionVerifier key."""
         self.api_key: str = million_key
+        self.bulk_threshold: int = bulk_threshold
+        self.bulk_timeout: float = bulk_timeout  # seconds
+        self.drop_empty: bool = drop_empty
+        self._session = requests.Session()
+        self._cache = open_cache(cache_dir) if cache_dir else None
+        self.cache_ttl: float = cache_ttl  # seconds
 
-    def _validate_email(self, email: str) -> bool:
-        """Validate an email with MillionVerifier."""
-        response = requests.get(
+    def _validate_email(self, email: str) -> str:
+        """Validate an email with MillionVerifier. Returns the result, ex. 'ok'."""
+        response = self._session.get(
             "https://api.millionverifier.com/api/v3",
             params={
                 "api": self.api_key,
@@ -28,16 +74,113 @@ class EmailValidator(BaseValidator):
         response.raise_for_status()
         response_json = response.json()
 
-        if "resultcode" not in response_json:
+        if response_json.get("resultcode") not in RESULTS:
+            raise ValueError(f"Unexpected response from MillionVerifier: {response_json}")
+
+        return RESULTS[response_json["resultcode"]]
+
+    def _validate_emails_bulk(self, emails: list[str]) -> dict[str, str]:
+        """
+        Validate emails with a single MillionVerifier bulk file.
+        Returns the result of each email in the file, ex. 'ok'.
+
+        Raises if the file ends in error, is canceled or paused, or doesn't finish
+        within `bulk_timeout`.
+        """
+        # Upload
+        response = self._session.post(
+            f"{BULK_API_URL}/upload",
+            params={"key": self.api_key},
+            files={"file_contents": ("emails.csv", "\n".join(["email", *emails]))}
+        )
+        response.raise_for_status()
+        response_json = response.json()
+
+        if "file_id" not in response_json:
             raise ValueError(f"Unexpected response from MillionVerifier: {response_json}")
 
-        return response_json["resultcode"] == 1
+        file_id = response_json["file_id"]
+
+        # Poll until processed, backing off with jitter
+        delay: float = 2.0
+        deadline: float = time.monotonic() + self.bulk_timeout
+
+        while True:
+            response = self._session.get(
+                f"{BULK_API_URL}/fileinfo",
+                params={"key": self.api_key, "file_id": file_id}
+            )
+            response.raise_for_status()
+            status: str = response.json().get("status", "")
+
+            if status == "finished":
+                break
+
+            if status in ("error", "canceled", "paused"):
+                raise ValueError(f"MillionVerifier bulk file {file_id} ended as '{status}'.")
+
+            if time.monotonic() + delay > deadline:
+                raise TimeoutError(f"MillionVerifier bulk file {file_id} did not finish in time.")
+
+            time.sleep(delay + random.uniform(0, delay * 0.25))
+            delay = min(delay * 2, 30.0)
+
+        # Download every email with its result
+        response = self._session.get(
+            f"{BULK_API_URL}/download",
+            params={"key": self.api_key, "file_id": file_id, "filter": "all"}
+        )
+        response.raise_for_status()
+
+        reader = csv.DictReader(StringIO(response.text))
+        if not {"email", "result"} <= set(reader.fieldnames or []):
+            raise ValueError(f"Unexpected bulk file from MillionVerifier: {response.text[:200]}")
+
+        return {row["email"]: row["result"] for row in reader if row["email"]}
 
     def validate(self, md5s: list[MD5WithPII]) -> list[MD5WithPII]:
         """Remove any emails that are not 'good'."""
+        # Deduplicate (keeping order) so each email is only validated once
+        all_emails: list[str] = list(
+            dict.fromkeys(email for md5 in md5s for email in md5.pii.emails)
+        )
+
+        # Use cached verdicts where possible
+        valid_emails: set[str] = set()
+        unknown_emails: list[str] = []
+
+        for email in all_emails:
+            verdict: bool | None = None
+            if self._cache is not None:
+                verdict = self._cache.get(("email", email))
+
+            if verdict is None:
+                unknown_emails.append(email)
+            elif verdict:
+                valid_emails.add(email)
+
+        results: dict[str, str]
+        if len(unknown_emails) < self.bulk_threshold:
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                results = dict(
+                    zip(unknown_emails, executor.map(self._validate_email, unknown_emails))
+                )
+        else:
+            # Emails missing from the bulk file are dropped, but not cached
+            results = self._validate_emails_bulk(unknown_emails)
+
+        for email, result in results.items():
+            if result == "ok":
+                valid_emails.add(email)
+
+            if self._cache is not None and result not in TEMPORARY_RESULTS:
+                self._cache.set(("email", email), result == "ok", expire=self.cache_ttl)
+
+        return_md5s: list[MD5WithPII] = []
         for md5 in md5s:
-            md5.pii.emails = [
-                email for email in md5.pii.emails if self._validate_email(email)
-            ]
+            md5.pii.emails = [email for email in md5.pii.emails if email in valid_emails]
+
+            if md5.pii.emails or not self.drop_empty:
+                return_md5s.append(md5)
 
-        return md5s
+        return return_md5s
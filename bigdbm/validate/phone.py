@@ -1,6 +1,9 @@
 """Validate phone numbers using numverify."""
 import requests
 
+from concurrent.futures import ThreadPoolExecutor
+
+from bigdbm.cache import open_cache
 from bigdbm.schemas import MD5WithPII
 from bigdbm.validate.base import BaseValidator
 
@@ -8,11 +11,22 @@ from bigdbm.validate.base import BaseValidator
 class PhoneValidator(BaseValidator):
     """
     Remove US phone numbers determined to not be 'valid' by MillionVerifier.
+
+    With `cache_dir`, verdicts are kept on disk for `cache_ttl` seconds so
+    phones seen in previous runs aren't validated again.
     """
 
-    def __init__(self, numverify_key: str) -> None:
+    def __init__(
+        self,
+        numverify_key: str,
+        cache_dir: str | None = None,
+        cache_ttl: float = 30 * 86400
+    ) -> None:
         """Initialize with numverify key."""
         self.api_key: str = numverify_key
+        self._session = requests.Session()
+        self._cache = open_cache(cache_dir) if cache_dir else None
+        self.cache_ttl: float = cache_ttl  # seconds
 
     def _validate_phone(self, phone: str) -> bool:
         """Validate a US phone number with numverify."""
@@ -26,7 +40,7 @@ class PhoneValidator(BaseValidator):
         if len(phone) != 10:
             return False
         
-        response = requests.get(
+        response = self._session.get(
             "https://apilayer.net/api/validate",
             params={
                 "access_key": self.api_key,
@@ -45,9 +59,38 @@ class PhoneValidator(BaseValidator):
 
     def validate(self, md5s: list[MD5WithPII]) -> list[MD5WithPII]:
         """Remove any phone numbers that are not 'good'."""
+        # Deduplicate (keeping order) so each phone is only validated once
+        all_phones: list[str] = list(
+            dict.fromkeys(phone.phone for md5 in md5s for phone in md5.pii.mobile_phones)
+        )
+
+        # Use cached verdicts where possible
+        valid_phones: set[str] = set()
+        unknown_phones: list[str] = []
+
+        for phone in all_phones:
+            verdict: bool | None = None
+            if self._cache is not None:
+                verdict = self._cache.get(("phone", phone))
+
+            if verdict is None:
+                unknown_phones.append(phone)
+            elif verdict:
+                valid_phones.add(phone)
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            valid_idx = executor.map(self._validate_phone, unknown_phones)
+
+        for phone, ok in zip(unknown_phones, valid_idx):
+            if ok:
+                valid_phones.add(phone)
+
+            if self._cache is not None:
+                self._cache.set(("phone", phone), bool(ok), expire=self.cache_ttl)
+
         for md5 in md5s:
             md5.pii.mobile_phones = [
-                phone for phone in md5.pii.mobile_phones if self._validate_phone(phone.phone)
+                phone for phone in md5.pii.mobile_phones if phone.phone in valid_phones
             ]
 
         return md5s
@@ -1,23 +1,21 @@
 """Gender validator. Only show hems of a certain verified gender."""
 from bigdbm.schemas import MD5WithPII, Gender
-from bigdbm.validate.base import BaseValidator
+from bigdbm.validate.base import FilterValidator
 
 
-class GenderValidator(BaseValidator):
+class GenderValidator(FilterValidator):
     """Only show hems of a certain verified gender."""
 
     def __init__(self, *gender: Gender) -> None:
         """Initialize with the filtered gender."""
         self.genders: tuple[Gender] = gender
 
-    def validate(self, md5s: list[MD5WithPII]) -> list[MD5WithPII]:
-        """Only return hems whose gender exists in the initialized list of genders."""
-        return [
-            md5 for md5 in md5s if md5.pii.gender in self.genders
-        ]
+    def matches(self, md5: MD5WithPII) -> bool:
+        """Only keep hems whose gender exists in the initialized list of genders."""
+        return md5.pii.gender in self.genders
 
 
-class AgeValidator(BaseValidator):
+class AgeValidator(FilterValidator):
     """
     Only show hems of people above or below a certain age.
     Works inclusively, ex. 50 means 50 or higher/50 or lower.
@@ -31,15 +29,11 @@ class AgeValidator(BaseValidator):
         self.min_age = int(min_age)
         self.max_age = int(max_age)
 
-    def validate(self, md5s: list[MD5WithPII]) -> list[MD5WithPII]:
-        """Remove hems that do not match the age requirement."""
-        def is_valid(md5: MD5WithPII) -> bool:
-            """Check if the MD5 is in the age range."""
-            try:
-                age = int(md5.pii.age)
-            except ValueError:
-                return False
-
-            return self.min_age <= age <= self.max_age
-        
-        return [md5 for md5 in md5s if is_valid(md5)]
+    def matches(self, md5: MD5WithPII) -> bool:
+        """Check if the MD5 is in the age range."""
+        try:
+            age = int(md5.pii.age)
+        except ValueError:
+            return False
+
+        return self.min_age <= age <= self.max_age
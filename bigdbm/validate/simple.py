@@ -1,33 +1,29 @@
 """Basic validation: zip codes, contactable, etc."""
 from bigdbm.schemas import MD5WithPII
-from bigdbm.validate.base import BaseValidator
+from bigdbm.validate.base import FilterValidator
 
 
-class ZipCodeValidator(BaseValidator):
+class ZipCodeValidator(FilterValidator):
     """Remove hems that do not match an input zip code."""
 
     def __init__(self, zip_codes: list[str]) -> None:
         """Initialize with a list of zip codes."""
         self.zip_codes: list[str] = zip_codes
 
-    def validate(self, md5s: list[MD5WithPII]) -> list[MD5WithPII]:
-        """Remove items that are not in the list of zip codes."""
-        return [
-            md5 for md5 in md5s if md5.pii.zip_code in self.zip_codes
-        ]
+    def matches(self, md5: MD5WithPII) -> bool:
+        """Keep items that are in the list of zip codes."""
+        return md5.pii.zip_code in self.zip_codes
 
 
-class ContactableValidator(BaseValidator):
+class ContactableValidator(FilterValidator):
     """Remove hems that don't have at least one mode of contact."""
 
-    def validate(self, md5s: list[MD5WithPII]) -> list[MD5WithPII]:
-        """Remove hems that don't have at least one mode of contact."""
-        return [
-            md5 for md5 in md5s if any([md5.pii.mobile_phones, md5.pii.emails])
-        ]
+    def matches(self, md5: MD5WithPII) -> bool:
+        """Keep hems that have at least one mode of contact."""
+        return bool(md5.pii.mobile_phones or md5.pii.emails)
 
 
-class MD5Validator(BaseValidator):
+class MD5Validator(FilterValidator):
     """
     Remove hems that match a list of MD5s.
 
@@ -38,8 +34,6 @@ class MD5Validator(BaseValidator):
         """Initialize with a list of blacklisted MD5s."""
         self.md5_strings: list[str] = md5_strings
 
-    def validate(self, md5s: list[MD5WithPII]) -> list[MD5WithPII]:
-        """Remove hems that match the initialized list of MD5 strings."""
-        return [
-            md5 for md5 in md5s if md5.md5 not in self.md5_strings
-        ]
+    def matches(self, md5: MD5WithPII) -> bool:
+        """Keep hems that don't match the initialized list of MD5 strings."""
+        return md5.md5 not in self.md5_strings
@@ -2,9 +2,11 @@
 import pytest
 
 import os
+from typing import Any, Callable
 from dotenv import load_dotenv
 
 from bigdbm.client import BigDBMClient
+from bigdbm.schemas import MD5WithPII, PII
 
 
 # Load env
@@ -21,3 +23,44 @@ def bigdbm_client() -> BigDBMClient:
         raise ValueError("Need CLIENT_ID and CLIENT_SECRET variables to run tests.")
 
     return BigDBMClient(client_id, client_secret)
+
+
+def _api_dict(**overrides: Any) -> dict[str, Any]:
+    """PII as returned by the API for output 10008, with overrides."""
+    api_dict: dict[str, Any] = {
+        "Id": "1",
+        "Address": "1 Main St",
+        "City": "McLean",
+        "First_Name": "Jane",
+        "Last_Name": "Doe",
+        "State": "VA",
+        "Zip": "22101",
+        "Email_Array": ["jane@example.com"],
+        "Gender": "Female",
+        "Age": "40",
+        "Children_HH": "1",
+        "Credit_Range": "A",
+        "Home_Owner": "Home Owner",
+        "Income_HH": "$100,000 - $149,999",
+        "Net_Worth_HH": "$250,000 - $499,999",
+        "Marital_Status": "Married",
+        "Occupation_Detail": "Engineer",
+        "Veteran_HH": "0",
+        "Mobile_Phone_1": "5555550100",
+        "Mobile_Phone_1_DNC": "0"
+    }
+    api_dict.update(overrides)
+    return api_dict
+
+
+@pytest.fixture
+def make_md5() -> Callable[..., MD5WithPII]:
+    """Build an MD5WithPII offline. Keyword arguments override API PII fields."""
+    def make(md5: str = "md5", sentences: list[str] | None = None, **overrides: Any) -> MD5WithPII:
+        return MD5WithPII(
+            md5=md5,
+            sentences=sentences or ["Real Estate"],
+            pii=PII.from_api_dict(_api_dict(**overrides))
+        )
+
+    return make
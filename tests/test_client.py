@@ -0,0 +1,358 @@
+"""Offline client tests, with the HTTP layer replaced by fake responses."""
+import pytest
+import requests
+
+import json
+import threading
+import time
+from typing import Any, Callable
+
+from bigdbm.client import BigDBMClient
+from bigdbm.schemas import UniqueMD5
+from bigdbm.validate.phone import PhoneValidator
+from tests.conftest import _api_dict
+
+
+TOKEN_URL: str = "https://aws-prod-auth-service.bigdbm.com/oauth2/token"
+
+
+def make_response(url: str, body: Any = None, status_code: int = 200) -> requests.Response:
+    """Build a requests Response with a JSON body."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = url
+    response._content = json.dumps(body).encode()
+    return response
+
+
+@pytest.fixture(autouse=True)
+def fresh_token_cache(monkeypatch):
+    """Don't share access tokens between tests."""
+    monkeypatch.setattr(BigDBMClient, "_TOKEN_CACHE", {})
+    monkeypatch.setattr(BigDBMClient, "_TOKEN_LOCKS", {})
+
+
+@pytest.fixture
+def fake_api(monkeypatch) -> Callable[[Callable[..., requests.Response]], list]:
+    """
+    Route every `requests.Session.request` to a handler taking
+    (method, url, body) and returning a Response. Token requests are answered
+    automatically. Returns the list of (method, url, body) calls made.
+    """
+    def install(handler: Callable[..., requests.Response]) -> list:
+        calls: list = []
+
+        def request(session, method, url, data=None, **kwargs):
+            if url == TOKEN_URL:
+                calls.append((method, url, None))
+                return make_response(url, {"access_token": "token", "expires_in": 3600})
+
+            body = json.loads(data) if isinstance(data, bytes) else None
+            calls.append((method, url, body))
+            return handler(method, url, body)
+
+        monkeypatch.setattr(requests.Session, "request", request)
+        return calls
+
+    return install
+
+
+def test_token_fetched_lazily_and_shared(fake_api):
+    calls = fake_api(lambda method, url, body: make_response(url, {"status": 100}))
+
+    client = BigDBMClient("id", "secret")
+    assert not calls
+
+    client.get_list_status(1)
+    BigDBMClient("id", "secret").get_list_status(1)
+
+    assert [url for _, url, _ in calls].count(TOKEN_URL) == 1
+
+
+def test_token_fetches_only_block_same_credentials(monkeypatch):
+    slow_fetch_started = threading.Event()
+    release_slow_fetch = threading.Event()
+
+    def request(session, method, url, data=None, **kwargs):
+        if data["client_id"] == "slow":
+            slow_fetch_started.set()
+            release_slow_fetch.wait(5)
+
+        return make_response(url, {"access_token": data["client_id"], "expires_in": 3600})
+
+    monkeypatch.setattr(requests.Session, "request", request)
+
+    slow_thread = threading.Thread(target=BigDBMClient("slow", "secret")._update_token)
+    slow_thread.start()
+    slow_fetch_started.wait(5)
+
+    try:
+        start = time.monotonic()
+        fast_client = BigDBMClient("fast", "secret")
+        fast_client._update_token()
+        assert time.monotonic() - start < 1
+        assert fast_client._access_token == "fast"
+    finally:
+        release_slow_fetch.set()
+        slow_thread.join()
+
+
+def test_create_job_not_retried_on_server_errors():
+    client = BigDBMClient("id", "secret")
+
+    create_retry = client._session.get_adapter(
+        "https://aws-prod-intent-api.bigdbm.com/intent/createList"
+    ).max_retries
+    assert create_retry.read == 0
+    assert set(create_retry.status_forcelist) == {429}
+
+    result_retry = client._session.get_adapter(
+        "https://aws-prod-intent-api.bigdbm.com/intent/result"
+    ).max_retries
+    assert {500, 502, 503, 504} <= set(result_retry.status_forcelist)
+
+
+def pii_handler(method: str, url: str, body: Any) -> requests.Response:
+    """Answer PII requests with a record for every MD5 asked for."""
+    return make_response(
+        url, {"returnData": {md5: [{"Id": md5}] for md5 in body["ObjectList"]}}
+    )
+
+
+def pii_requests(calls: list) -> list[list[str]]:
+    """MD5s sent in each PII request."""
+    return [body["ObjectList"] for _, url, body in calls if url != TOKEN_URL]
+
+
+def test_pull_pii_chunks_and_dedups(fake_api):
+    calls = fake_api(pii_handler)
+    client = BigDBMClient("id", "secret")
+
+    md5s = [str(i) for i in range(client._PII_CHUNK + 1)]
+    data = client._pull_pii(md5s + md5s[:10])
+
+    assert set(data) == set(md5s)
+    sent = pii_requests(calls)
+    assert sorted(map(len, sent)) == [1, client._PII_CHUNK]
+    assert sorted(md5 for chunk in sent for md5 in chunk) == sorted(md5s)
+
+
+def test_pull_pii_cache_hits_skip_api(fake_api):
+    calls = fake_api(pii_handler)
+    client = BigDBMClient("id", "secret")
+
+    client._pull_pii(["a", "b"])
+    assert client._pull_pii(["a", "b", "c"]) == {md5: {"Id": md5} for md5 in "abc"}
+    assert pii_requests(calls) == [["a", "b"], ["c"]]
+
+
+def test_pull_pii_evicts_least_recently_used(fake_api):
+    calls = fake_api(pii_handler)
+    client = BigDBMClient("id", "secret", pii_cache_size=2)
+
+    client._pull_pii(["a"])
+    client._pull_pii(["b"])
+    client._pull_pii(["a"])  # hit, "b" is now least recently used
+    client._pull_pii(["c"])
+    client._pull_pii(["a", "b"])
+
+    assert pii_requests(calls) == [["a"], ["b"], ["c"], ["b"]]
+
+
+def test_pull_pii_cache_expires(fake_api, monkeypatch):
+    calls = fake_api(pii_handler)
+    client = BigDBMClient("id", "secret", pii_cache_ttl=60)
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+    client._pull_pii(["a"])
+    client._pull_pii(["a"])
+
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+    client._pull_pii(["a"])
+
+    assert pii_requests(calls) == [["a"], ["a"]]
+
+
+def test_cached_pii_not_modified(fake_api):
+    fake_api(lambda method, url, body: make_response(
+        url, {"returnData": {"a": [_api_dict(Email_Array=None)]}}
+    ))
+    client = BigDBMClient("id", "secret")
+    unique_md5s = [UniqueMD5(md5="a", sentences=["Real Estate"])]
+
+    first = client.pii_for_unique_md5s(unique_md5s)
+    first[0].pii.emails.append("new@example.com")
+
+    assert client._get_cached_pii((10008, "a"))["Email_Array"] is None
+    assert client.pii_for_unique_md5s(unique_md5s)[0].pii.emails == []
+
+
+def test_flush_pii_cache_keeps_shared_verdicts(fake_api, make_md5, tmp_path, monkeypatch):
+    pytest.importorskip("diskcache")
+    calls = fake_api(pii_handler)
+    client = BigDBMClient("id", "secret", pii_cache_dir=str(tmp_path))
+    validator = PhoneValidator("key", cache_dir=str(tmp_path))
+    monkeypatch.setattr(validator, "_validate_phone", lambda phone: True)
+
+    client._pull_pii(["a"])
+    validator.validate([make_md5("a", Mobile_Phone_1="5555550100")])
+    client.flush_pii_cache()
+
+    client._pull_pii(["a"])
+    assert pii_requests(calls) == [["a"], ["a"]]
+    assert validator._cache.get(("phone", "5555550100")) is True
+
+
+RESULT_URL: str = "https://aws-prod-intent-api.bigdbm.com/intent/result"
+
+
+def result_page(page: int, total_count: int) -> dict[str, Any]:
+    """A page of intent results with one event, named after the page."""
+    return {"result": [{"mD5": f"md5-{page}", "sentence": "Real Estate"}], "totalCount": total_count}
+
+
+def test_single_page_job_doesnt_wait_on_page_2(fake_api):
+    release_page_2 = threading.Event()
+
+    def handler(method, url, body):
+        if body["Page"] == 2:
+            release_page_2.wait(3)
+        else:
+            time.sleep(0.1)
+
+        return make_response(url, result_page(body["Page"], 1))
+
+    fake_api(handler)
+    client = BigDBMClient("id", "secret")
+
+    try:
+        start = time.monotonic()
+        events = client.retrieve_md5s(1)
+        assert time.monotonic() - start < 1
+    finally:
+        release_page_2.set()
+
+    assert [event.md5 for event in events] == ["md5-1"]
+
+
+@pytest.mark.parametrize("n_threads", [1, 4])
+def test_pages_kept_in_order(fake_api, n_threads):
+    def handler(method, url, body):
+        time.sleep(0.01 * (5 - body["Page"]))  # later pages finish first
+        return make_response(url, result_page(body["Page"], 4))
+
+    calls = fake_api(handler)
+    events = BigDBMClient("id", "secret").retrieve_md5s(1, n_threads=n_threads)
+
+    assert [event.md5 for event in events] == ["md5-1", "md5-2", "md5-3", "md5-4"]
+    assert sorted(body["Page"] for _, url, body in calls if url == RESULT_URL) == [1, 2, 3, 4]
+
+
+def test_empty_job(fake_api):
+    fake_api(lambda method, url, body: make_response(url, {"result": [], "totalCount": 0}))
+    assert BigDBMClient("id", "secret").retrieve_md5s(1) == []
+
+
+@pytest.fixture
+def fake_http2(fake_api, monkeypatch) -> Callable[[Callable[..., Any]], BigDBMClient]:
+    """
+    Route HTTP/2 result requests to an httpx handler, with tokens answered by
+    `fake_api`. Returns an `http2` client that doesn't sleep between retries,
+    recording the delays it would have used in `client.retry_delays`.
+    """
+    httpx = pytest.importorskip("httpx")
+
+    def install(handler: Callable[..., Any]) -> BigDBMClient:
+        monkeypatch.setattr(
+            httpx, "AsyncHTTPTransport", lambda **kwargs: httpx.MockTransport(handler)
+        )
+
+        client = BigDBMClient("id", "secret", http2=True)
+        client.token_calls = fake_api(lambda method, url, body: make_response(url, status_code=404))
+        client.retry_delays = []
+
+        def retry_delay(n_retry: int, retry_after: str | None = None) -> float:
+            client.retry_delays.append(BigDBMClient._retry_delay(client, n_retry, retry_after))
+            return 0
+
+        monkeypatch.setattr(client, "_retry_delay", retry_delay)
+        return client
+
+    return install
+
+
+def test_http2_single_page_job(fake_http2):
+    httpx = pytest.importorskip("httpx")
+    bodies: list = []
+
+    def handler(request):
+        assert request.headers["Content-Type"] == "application/json"
+        body = json.loads(request.content)
+        bodies.append(body)
+        return httpx.Response(200, json=result_page(body["Page"], 1))
+
+    events = fake_http2(handler).retrieve_md5s(7)
+
+    assert [event.md5 for event in events] == ["md5-1"]
+    assert {body["ListQueueId"] for body in bodies} == {7}
+
+
+def test_http2_refreshes_rejected_token(fake_http2):
+    httpx = pytest.importorskip("httpx")
+    statuses: list[int] = []
+
+    def handler(request):
+        status_code = 200 if statuses else 401
+        statuses.append(status_code)
+        return httpx.Response(status_code, json=result_page(json.loads(request.content)["Page"], 1))
+
+    client = fake_http2(handler)
+    events = client.retrieve_md5s(1)
+
+    assert [event.md5 for event in events] == ["md5-1"]
+    assert statuses.count(401) == 1
+    assert [url for _, url, _ in client.token_calls].count(TOKEN_URL) == 2
+
+
+def test_http2_respects_retry_after(fake_http2):
+    httpx = pytest.importorskip("httpx")
+    attempts: list[int] = []
+
+    def handler(request):
+        page = json.loads(request.content)["Page"]
+        if page == 1 and not attempts:
+            attempts.append(page)
+            return httpx.Response(503, headers={"Retry-After": "7"})
+
+        return httpx.Response(200, json=result_page(page, 2))
+
+    client = fake_http2(handler)
+    events = client.retrieve_md5s(1)
+
+    assert [event.md5 for event in events] == ["md5-1", "md5-2"]
+    assert client.retry_delays == [7]
+
+
+def test_http2_persistent_server_error(fake_http2):
+    httpx = pytest.importorskip("httpx")
+    client = fake_http2(lambda request: httpx.Response(500))
+
+    with pytest.raises(requests.HTTPError, match="500"):
+        client.retrieve_md5s(1)
+
+    assert len(client.retry_delays) >= client._retry.total
+
+
+def test_http2_connection_error(fake_http2):
+    httpx = pytest.importorskip("httpx")
+
+    def handler(request):
+        raise httpx.ConnectError("connection refused", request=request)
+
+    client = fake_http2(handler)
+
+    with pytest.raises(requests.ConnectionError):
+        client.retrieve_md5s(1)
+
+    assert len(client.retry_delays) >= client._retry.total
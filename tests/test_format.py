@@ -0,0 +1,56 @@
+"""Offline output formatter tests."""
+import pandas as pd
+
+from io import StringIO
+from typing import Any
+
+from bigdbm.format.csv import CSVStringFormatter, OUTPUT_COLUMNS
+from bigdbm.schemas import MD5WithPII, LEAD_EXPORT_GETTERS
+
+
+def lead_export_csv(pii_md5s: list[MD5WithPII], columns: list[str]) -> str:
+    """CSV built the original way, from `PII.as_lead_export` dictionaries."""
+    lead_dicts: list[dict[str, Any]] = [
+        {
+            "md5": md5.md5,
+            "intents": ", ".join(md5.sentences),
+            **md5.pii.as_lead_export()
+        }
+        for md5 in pii_md5s
+    ]
+
+    string_io = StringIO()
+    pd.DataFrame(lead_dicts)[columns].to_csv(string_io, index=False)
+    return string_io.getvalue()
+
+
+def test_csv_matches_lead_export(make_md5):
+    pii_md5s: list[MD5WithPII] = [
+        make_md5(
+            "full",
+            sentences=["Real Estate", "Home, Garden"],
+            First_Name='Jane "JJ"',
+            Address="1 Main St, Apt 2",
+            Email_Array=["a@x.com", "b@x.com", "c@x.com", "d@x.com"],
+            Mobile_Phone_2="5555550101",
+            Mobile_Phone_2_DNC="1",
+            Mobile_Phone_3="5555550102",
+            Mobile_Phone_3_DNC="0"
+        ),
+        make_md5("no_contact", Email_Array=None, Mobile_Phone_1="", Gender=""),
+        make_md5("multiline", Occupation_Detail="Line one\nLine two", Credit_Range="")
+    ]
+
+    for columns in (OUTPUT_COLUMNS, list(LEAD_EXPORT_GETTERS)):
+        assert CSVStringFormatter(columns).format_md5s(pii_md5s) == lead_export_csv(
+            pii_md5s, columns
+        )
+
+
+def test_export_getters_cover_lead_export(make_md5):
+    md5: MD5WithPII = make_md5()
+    assert set(LEAD_EXPORT_GETTERS) == {"md5", "intents", *md5.pii.as_lead_export()}
+
+
+def test_empty_csv():
+    assert CSVStringFormatter().format_md5s([]) == ""
@@ -0,0 +1,129 @@
+"""Offline validator tests."""
+import pytest
+import requests
+
+import json
+
+from bigdbm.schemas import MD5WithPII
+from bigdbm.validate.base import BaseValidator, run_validators
+from bigdbm.validate.email import EmailValidator
+from bigdbm.validate.pii import AgeValidator
+from bigdbm.validate.simple import ContactableValidator, ZipCodeValidator
+
+
+class DropFirstEmailValidator(BaseValidator):
+    """Non-filter validator: mutates hems and depends on the whole list's order."""
+
+    def validate(self, md5s: list[MD5WithPII]) -> list[MD5WithPII]:
+        for md5 in md5s[::2]:
+            md5.pii.emails = md5.pii.emails[1:]
+
+        return md5s[::-1]
+
+
+def build_md5s(make_md5) -> list[MD5WithPII]:
+    return [
+        make_md5("a", Zip="22101", Email_Array=["a@x.com"], Mobile_Phone_1=""),
+        make_md5("b", Zip="22101", Email_Array=["b@x.com", "b2@x.com"], Mobile_Phone_1=""),
+        make_md5("c", Zip="10001", Email_Array=["c@x.com"]),
+        make_md5("d", Zip="22101", Email_Array=[], Age="70"),
+        make_md5("e", Zip="22101", Email_Array=["e@x.com"], Mobile_Phone_1="", Age="x"),
+        make_md5("f", Zip="22101", Email_Array=["f@x.com"], Mobile_Phone_1="", Age="30")
+    ]
+
+
+@pytest.mark.parametrize(
+    "validators",
+    [
+        [],
+        [ZipCodeValidator(["22101"])],
+        [ZipCodeValidator(["22101"]), AgeValidator(18, 65)],
+        [ZipCodeValidator(["22101"]), DropFirstEmailValidator(), ContactableValidator()],
+        [DropFirstEmailValidator(), ContactableValidator(), AgeValidator(18, 65)],
+        [
+            ZipCodeValidator(["22101"]),
+            AgeValidator(18, 65),
+            DropFirstEmailValidator(),
+            ContactableValidator(),
+            DropFirstEmailValidator()
+        ]
+    ]
+)
+def test_run_validators_matches_sequential(make_md5, validators):
+    expected: list[MD5WithPII] = build_md5s(make_md5)
+    for validator in validators:
+        expected = validator.validate(expected)
+
+    result: list[MD5WithPII] = run_validators(validators, build_md5s(make_md5))
+
+    assert [(md5.md5, md5.pii.emails) for md5 in result] == [
+        (md5.md5, md5.pii.emails) for md5 in expected
+    ]
+
+
+def make_response(body: str, status_code: int = 200) -> requests.Response:
+    """Build a requests Response with a text body."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body.encode()
+    return response
+
+
+class FakeBulkSession:
+    """Stands in for MillionVerifier's bulk API, returning `download` as the file."""
+
+    def __init__(self, download: str) -> None:
+        self.download: str = download
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return make_response(json.dumps({"file_id": 1}))
+
+    def get(self, url: str, params: dict, **kwargs) -> requests.Response:
+        if url.endswith("/fileinfo"):
+            return make_response(json.dumps({"status": "finished"}))
+
+        assert params["filter"] == "all"
+        return make_response(self.download)
+
+
+def test_email_temporary_results_not_cached(make_md5, tmp_path, monkeypatch):
+    pytest.importorskip("diskcache")
+    results: dict[str, str] = {"a@x.com": "ok", "b@x.com": "unknown", "c@x.com": "invalid"}
+    calls: list[str] = []
+
+    def validate_email(email: str) -> str:
+        calls.append(email)
+        return results[email]
+
+    validator = EmailValidator("key", cache_dir=str(tmp_path))
+    monkeypatch.setattr(validator, "_validate_email", validate_email)
+    build = lambda: [make_md5("a", Email_Array=list(results))]
+
+    assert validator.validate(build())[0].pii.emails == ["a@x.com"]
+    assert validator.validate(build())[0].pii.emails == ["a@x.com"]
+    assert sorted(calls) == ["a@x.com", "b@x.com", "b@x.com", "c@x.com"]
+
+
+def test_email_bulk_results(make_md5, tmp_path):
+    pytest.importorskip("diskcache")
+    validator = EmailValidator("key", bulk_threshold=1, cache_dir=str(tmp_path))
+    validator._session = FakeBulkSession(
+        "email,quality,result\n"
+        "a@x.com,good,ok\n"
+        "b@x.com,,unknown\n"
+        "c@x.com,bad,invalid\n"
+    )
+    emails: list[str] = ["a@x.com", "b@x.com", "c@x.com", "missing@x.com"]
+
+    assert validator.validate([make_md5("a", Email_Array=emails)])[0].pii.emails == ["a@x.com"]
+    assert {email: validator._cache.get(("email", email)) for email in emails} == {
+        "a@x.com": True, "b@x.com": None, "c@x.com": False, "missing@x.com": None
+    }
+
+
+def test_email_bulk_unexpected_file(make_md5):
+    validator = EmailValidator("key", bulk_threshold=1)
+    validator._session = FakeBulkSession("email\na@x.com\n")
+
+    with pytest.raises(ValueError, match="Unexpected bulk file"):
+        validator.validate([make_md5("a", Email_Array=["a@x.com"])])